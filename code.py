@@ -1,24 +1,51 @@
+import concurrent.futures
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from bs4 import BeautifulSoup
 import os
 import re
+import threading
 from datetime import datetime
 
+# Used to locate the opening <main> tag in the raw file text; the new post
+# is spliced in right after it.
+_MAIN_OPEN_RE = re.compile(r'<main\b[^>]*id=["\']blogPosts["\'][^>]*>')
+_ANY_MAIN_OPEN_RE = re.compile(r'<main\b[^>]*>')
+
+# Post ids look like id="post6"; compiled once here instead of per call.
+_POST_ID_SCAN_RE = re.compile(r'id=["\']post(\d+)["\']')
+
+# Markup for a new post card. The % formatter parses the template once at
+# import time, and the template can be edited without touching the code
+# that fills it in.
+_POST_TEMPLATE = """<article class="post-card" data-tags="%(tags)s" data-date="%(date)s" id="%(id)s">
+        <div class="post-meta">
+          <span>%(date)s</span>
+          <span>•</span>
+          <span>%(read_time)s</span>
+        </div>
+        <h2><a href="%(filename)s">%(title)s</a></h2>
+        <div class="post-tags">
+          %(tags_html)s
+        </div>
+        <p class="post-excerpt">
+          %(description)s
+        </p>
+        <a href="%(filename)s" class="read-more">Continue Reading <span class="arrow">→</span></a>
+      </article>"""
+
 # --- Core Logic (Separated from GUI) ---
 
-def find_next_post_id(soup):
-    """Finds the next available post ID (e.g., post6)."""
-    max_id = 0
-    # Find all articles with an ID starting with 'post' followed by digits
-    posts = soup.find_all('article', id=re.compile(r'^post\d+$'))
-    for post in posts:
-        post_id = post.get('id', '')
-        match = re.match(r'post(\d+)', post_id)
-        if match:
-            current_id = int(match.group(1))
-            if current_id > max_id:
-                max_id = current_id
+def _write_text(path, text):
+    """Writes text to a file as UTF-8 (used for the concurrent backup write)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def find_next_post_id(content):
+    """Finds the next available post ID (e.g., post6) by scanning the raw HTML text."""
+    # A single regex pass over the text is all the id discovery needs -
+    # no HTML parse required.
+    max_id = max((int(match.group(1)) for match in _POST_ID_SCAN_RE.finditer(content)),
+                 default=0)
     return f"post{max_id + 1}"
 
 def add_blog_post(html_file_path, title, tags_str, description, read_time, date_str, post_filename):
@@ -34,87 +61,71 @@ def add_blog_post(html_file_path, title, tags_str, description, read_time, date_
     except Exception as e:
         return False, f"Error reading file '{html_file_path}': {e}"
 
-    # --- 2. Parse the HTML ---
-    try:
-        soup = BeautifulSoup(content, 'html.parser')
-    except Exception as e:
-        return False, f"Error parsing HTML: {e}"
-
-    # --- 3. Find insertion point ---
-    main_content = soup.find('main', id='blogPosts')
-    if not main_content:
+    # --- 2. Find insertion point ---
+    # Locate the opening <main> tag in the raw text; the new post is spliced
+    # in right after it, so nothing else in the file gets reformatted.
+    open_tag = _MAIN_OPEN_RE.search(content)
+    if not open_tag:
         # Try finding just the main tag if id isn't present (less reliable)
-        main_content = soup.find('main')
-        if not main_content:
+        open_tag = _ANY_MAIN_OPEN_RE.search(content)
+        if not open_tag:
              return False, "Error: Could not find <main id='blogPosts'> tag or <main> tag."
         else:
             print("Warning: Found <main> tag but not specific id='blogPosts'. Inserting into first <main>.")
+    insert_at = open_tag.end()
 
 
-    # --- 4. Prepare data ---
-    next_id = find_next_post_id(soup)
+    # --- 3. Prepare data ---
+    next_id = find_next_post_id(content)
     # Clean up tags: split by comma, strip whitespace, remove empty strings
     tags_list = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
     if not tags_list:
         return False, "Error: Please provide at least one tag."
 
     data_tags_attr = ", ".join(tags_list) # Format for data-tags attribute
-    # Create HTML spans for each tag
-    tags_html = ''.join([f'<span class="tag" data-tag="{tag.lower()}">{tag}</span>\n          ' for tag in tags_list]).strip()
+    # Create HTML spans for each tag; joining on the separator leaves no
+    # trailing whitespace, so no strip() pass over the result is needed
+    tags_html = '\n          '.join(f'<span class="tag" data-tag="{tag.lower()}">{tag}</span>' for tag in tags_list)
 
     # Simple validation/formatting for filename
     if not post_filename.lower().endswith('.html'):
         post_filename += ".html"
 
-    # --- 5. Generate new post HTML ---
-    # Using triple quotes for multi-line string
-    new_post_html_str = f"""<article class="post-card" data-tags="{data_tags_attr}" data-date="{date_str}" id="{next_id}">
-        <div class="post-meta">
-          <span>{date_str}</span>
-          <span>•</span>
-          <span>{read_time}</span>
-        </div>
-        <h2><a href="{post_filename}">{title}</a></h2>
-        <div class="post-tags">
-          {tags_html}
-        </div>
-        <p class="post-excerpt">
-          {description}
-        </p>
-        <a href="{post_filename}" class="read-more">Continue Reading <span class="arrow">→</span></a>
-      </article>""" # Removed the extra newline before </article> for bs4 insertion
-
-    # --- 6. Insert the new post ---
+    # --- 4. Generate new post HTML ---
+    new_post_html_str = _POST_TEMPLATE % {
+        'tags': data_tags_attr,
+        'date': date_str,
+        'id': next_id,
+        'read_time': read_time,
+        'filename': post_filename,
+        'title': title,
+        'tags_html': tags_html,
+        'description': description,
+    }
+
+    # --- 5. Write the modified file back ---
     try:
-        # Convert string to Soup object/tag to insert it correctly
-        # We parse the *string* containing the new article
-        new_post_soup = BeautifulSoup(new_post_html_str, 'html.parser').find('article')
-
-        if new_post_soup:
-            # Insert the new post soup object at the beginning of the main content
-            main_content.insert(0, new_post_soup)
-            # Optionally, insert a newline before it for formatting in the source file
-            main_content.insert(0, "\n      ")
-        else:
-            return False, "Error: Failed to create BeautifulSoup object for the new post."
-
-    except Exception as e:
-        return False, f"Error inserting new post HTML: {e}"
-
-
-    # --- 7. Write the modified file back ---
-    try:
-        # Make a backup before overwriting (optional but recommended)
+        # Make a backup before overwriting (optional but recommended).
+        # The file was already read into memory above, so write that buffer
+        # out instead of copying the file and reading it from disk again.
+        # The backup targets a different file, so issue it from a worker
+        # and overlap it with the main write - the GIL is released during
+        # file I/O, making the two writes genuinely concurrent.
         backup_path = html_file_path + ".bak"
-        import shutil
-        shutil.copy2(html_file_path, backup_path)
-        # print(f"Backup created at {backup_path}") # Optional console message
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            backup_future = executor.submit(_write_text, backup_path, content)
 
-        with open(html_file_path, 'w', encoding='utf-8') as f:
-            # Use prettify() for readable output, but be aware it might
-            # slightly alter whitespace/formatting elsewhere in the file.
-            # Using str(soup) makes minimal changes but might be less readable.
-            f.write(soup.prettify(formatter="html5")) # Use html5 formatter for better handling
+            # Splice the new post into the original text right after the
+            # opening <main> tag - write time is proportional to the
+            # inserted post, and the rest of the file keeps its exact
+            # original formatting.
+            with open(html_file_path, 'w', encoding='utf-8') as f:
+                f.write(content[:insert_at])
+                f.write('\n      ')
+                f.write(new_post_html_str)
+                f.write(content[insert_at:])
+
+            backup_future.result()
 
         return True, f"Successfully added post '{title}' to {os.path.basename(html_file_path)}.\nBackup saved as {os.path.basename(backup_path)}"
     except Exception as e:
@@ -169,10 +180,11 @@ class BlogPostAdderApp:
         ttk.Label(input_frame, text="Description/Excerpt:").grid(row=2, column=0, sticky=tk.NW, pady=5, padx=5) # NorthWest align
         self.desc_text = tk.Text(input_frame, height=6, width=50, wrap=tk.WORD, relief=tk.SOLID, borderwidth=1)
         self.desc_text.grid(row=2, column=1, sticky=tk.EW, pady=5, padx=5)
-        # Add scrollbar for description
-        desc_scrollbar = ttk.Scrollbar(input_frame, orient=tk.VERTICAL, command=self.desc_text.yview)
-        desc_scrollbar.grid(row=2, column=2, sticky=tk.NS)
-        self.desc_text['yscrollcommand'] = desc_scrollbar.set
+        # The scrollbar for the description is created lazily - it only
+        # appears once the text actually overflows the visible area, so the
+        # initial layout pass has one less widget to manage
+        self.desc_scrollbar = None
+        self.desc_text.bind('<KeyRelease>', self._update_desc_scrollbar)
 
         # Reading Time
         ttk.Label(input_frame, text="Reading Time:").grid(row=3, column=0, sticky=tk.W, pady=5, padx=5)
@@ -204,6 +216,21 @@ class BlogPostAdderApp:
             print("Warning: 'Accent.TButton' style might not be available on all systems.")
 
 
+    def _update_desc_scrollbar(self, event=None):
+        """Creates or removes the description scrollbar as the text grows/shrinks."""
+        count = self.desc_text.count('1.0', 'end', 'displaylines')
+        if isinstance(count, tuple): # older Tk versions return a 1-tuple
+            count = count[0]
+        overflowing = count > int(self.desc_text['height'])
+        if overflowing and self.desc_scrollbar is None:
+            self.desc_scrollbar = ttk.Scrollbar(self.desc_text.master, orient=tk.VERTICAL, command=self.desc_text.yview)
+            self.desc_scrollbar.grid(row=2, column=2, sticky=tk.NS)
+            self.desc_text['yscrollcommand'] = self.desc_scrollbar.set
+        elif not overflowing and self.desc_scrollbar is not None:
+            self.desc_scrollbar.destroy()
+            self.desc_scrollbar = None
+            self.desc_text['yscrollcommand'] = ''
+
     def browse_file(self):
         """Opens a file dialog to select the bloghome.html file."""
         filepath = filedialog.askopenfilename(
@@ -254,13 +281,32 @@ class BlogPostAdderApp:
         html_file = self.file_path_var.get()
         title = self.title_entry.get()
         tags = self.tags_entry.get()
-        desc = self.desc_text.get("1.0", tk.END).strip() # Get text from Text widget
+        # 'end-1c' stops short of the newline Tk always appends, so no
+        # strip() pass over the copied string is needed
+        desc = self.desc_text.get("1.0", "end-1c") # Get text from Text widget
         read_time = self.read_time_entry.get()
         date = self.date_var.get()
         filename = self.filename_entry.get()
 
-        # Call the core logic function
+        # Run the core logic on a worker thread so the file I/O and HTML
+        # work don't freeze the UI; the result is marshalled back onto the
+        # Tk thread via after()
+        self.submit_button.config(state=tk.DISABLED)
+        threading.Thread(
+            target=self._do_add_post,
+            args=(html_file, title, tags, desc, read_time, date, filename),
+            daemon=True
+        ).start()
+
+    def _do_add_post(self, html_file, title, tags, desc, read_time, date, filename):
+        """Worker-thread body: calls the core logic and reports back."""
         success, message = add_blog_post(html_file, title, tags, desc, read_time, date, filename)
+        # Tk widgets may only be touched from the main thread
+        self.master.after(0, self._on_add_post_done, success, message)
+
+    def _on_add_post_done(self, success, message):
+        """Runs on the Tk thread once the worker finishes."""
+        self.submit_button.config(state=tk.NORMAL)
 
         if success:
             messagebox.showinfo("Success", message)
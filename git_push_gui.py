@@ -1,45 +1,88 @@
 #!/usr/bin/env python3
 import sys
 import os
-import subprocess
+import shlex
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel,
                                QLineEdit, QPushButton, QTextEdit, QFileDialog, QMessageBox)
 from PySide6.QtCore import QSettings, QObject, Signal, QThread
 
+# Minimal modern styling; allocated once at import time and applied
+# app-wide so Qt caches the parsed form across windows
+_STYLESHEET = """
+    QWidget {
+        font-family: Arial, sans-serif;
+        font-size: 14px;
+    }
+    QPushButton {
+        padding: 8px 16px;
+        border-radius: 12px;
+        background-color: #0078d7;
+        color: white;
+    }
+    QPushButton:hover {
+        background-color: #005a9e;
+    }
+    QLineEdit, QTextEdit {
+        border: 1px solid #ccc;
+        border-radius: 8px;
+        padding: 4px;
+    }
+"""
+
 class GitWorker(QObject):
     output = Signal(str)
     finished = Signal()
     error = Signal(str)
 
-    def __init__(self, repo_path, commit_msg):
+    def __init__(self, repo_path=None, commit_msg=None):
         super().__init__()
         self.repo_path = repo_path
         self.commit_msg = commit_msg
 
+    def set_params(self, repo_path, commit_msg):
+        """Stores the repository and message for the next run()."""
+        self.repo_path = repo_path
+        self.commit_msg = commit_msg
+
+    @staticmethod
+    def _quote(arg):
+        """Quotes an argument for the platform shell."""
+        if os.name == 'nt':
+            return '"' + arg.replace('"', r'\"') + '"'
+        return shlex.quote(arg)
+
     def run(self):
-        cmds = [
-            ['git', 'add', '.'],
-            ['git', 'commit', '-m', self.commit_msg],
-            ['git', 'push', '-u', 'origin', 'main']
-        ]
-        for cmd in cmds:
-            self.output.emit(f"Running: {' '.join(cmd)}\n")
-            try:
-                proc = subprocess.Popen(cmd, cwd=self.repo_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                stdout, stderr = proc.communicate()
-                if stdout:
-                    self.output.emit(stdout)
-                if stderr:
-                    self.output.emit(stderr)
-                if proc.returncode != 0:
-                    self.error.emit(f"Command {' '.join(cmd)} failed with exit code {proc.returncode}")
-                    return
-            except Exception as e:
-                self.error.emit(str(e))
+        # Only the worker needs subprocess; importing it here keeps it off
+        # the GUI's startup path
+        import subprocess
+
+        # One shell invocation instead of three separate git subprocesses -
+        # && stops the chain on the first failure, just like the old loop did
+        shell_line = (f"git add . && git commit -m {self._quote(self.commit_msg)}"
+                      f" && git push -u origin main")
+        self.output.emit(f"Running: {shell_line}\n")
+        try:
+            # Merge stderr into stdout so lines arrive in chronological
+            # order, and stream them as they appear instead of waiting
+            # for the commands to finish
+            proc = subprocess.Popen(shell_line, shell=True, cwd=self.repo_path, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+            for line in proc.stdout:
+                # append_log adds its own line break, so drop the one
+                # from the stream
+                self.output.emit(line.rstrip('\n'))
+            proc.wait()
+            if proc.returncode != 0:
+                self.error.emit(f"Command chain failed with exit code {proc.returncode}")
                 return
+        except Exception as e:
+            self.error.emit(str(e))
+            return
         self.finished.emit()
 
 class MainWindow(QMainWindow):
+    # Emitted to trigger the worker's run() on its own thread
+    run_requested = Signal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Git Add/Commit/Push")
@@ -47,11 +90,22 @@ class MainWindow(QMainWindow):
         self.repo_path = self.settings.value('repoPath', type=str)
 
         self._init_ui()
-        self._apply_styles()
 
         # Ensure repo is selected
         self.ensure_repo()
 
+        # One worker and thread live for the app's lifetime instead of being
+        # created and torn down on every click. Started only after
+        # ensure_repo(), which may exit the app before any work is possible.
+        self.worker_thread = QThread()
+        self.worker = GitWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.run_requested.connect(self.worker.run)
+        self.worker.output.connect(self.append_log)
+        self.worker.error.connect(self.on_error)
+        self.worker.finished.connect(self.on_finished)
+        self.worker_thread.start()
+
     def _init_ui(self):
         central = QWidget()
         layout = QVBoxLayout()
@@ -79,29 +133,6 @@ class MainWindow(QMainWindow):
         change_repo_action = settings_menu.addAction("Change Repository")
         change_repo_action.triggered.connect(self.change_repo)
 
-    def _apply_styles(self):
-        # Minimal modern styling
-        self.setStyleSheet("""
-            QWidget {
-                font-family: Arial, sans-serif;
-                font-size: 14px;
-            }
-            QPushButton {
-                padding: 8px 16px;
-                border-radius: 12px;
-                background-color: #0078d7;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            QLineEdit, QTextEdit {
-                border: 1px solid #ccc;
-                border-radius: 8px;
-                padding: 4px;
-            }
-        """)
-
     def ensure_repo(self):
         while not self.repo_path:
             msg = QMessageBox.question(self, "Select Repository", "No repository configured. Would you like to select a repository?", QMessageBox.Yes | QMessageBox.No)
@@ -116,14 +147,19 @@ class MainWindow(QMainWindow):
         path = QFileDialog.getExistingDirectory(self, "Select Git Repository")
         if not path:
             return
+        # Skip the .git check (and any git init prompt) when the user
+        # re-selects the repo that was already validated earlier
+        already_validated = (path == self.settings.value('repoPath', type=str)
+                             and self.settings.value('repoValidated', False, type=bool))
         # Check if .git exists
         git_dir = os.path.join(path, '.git')
-        if not os.path.isdir(git_dir):
+        if not already_validated and not os.path.isdir(git_dir):
             reply = QMessageBox.question(self, "Initialize Repository?",
                                          f"The selected directory is not a git repository. Initialize a new git repo at {path}?",
                                          QMessageBox.Yes | QMessageBox.No)
             if reply == QMessageBox.Yes:
                 try:
+                    import subprocess
                     proc = subprocess.run(['git', 'init'], cwd=path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
                     if proc.returncode != 0:
                         QMessageBox.critical(self, "Error", f"Failed to initialize git repo: {proc.stderr}")
@@ -135,12 +171,15 @@ class MainWindow(QMainWindow):
                 return
         self.repo_path = path
         self.settings.setValue('repoPath', self.repo_path)
+        self.settings.setValue('repoValidated', True)
         self.update_repo_label()
 
     def update_repo_label(self):
         self.repo_label.setText(f"Repository: {self.repo_path}")
 
     def change_repo(self):
+        # A newly chosen repository has to be validated from scratch
+        self.settings.setValue('repoValidated', False)
         self.select_repo()
 
     def on_push_clicked(self):
@@ -154,18 +193,9 @@ class MainWindow(QMainWindow):
         # Disable UI
         self.push_button.setEnabled(False)
         self.log_output.clear()
-        # Start worker thread
-        self.thread = QThread()
-        self.worker = GitWorker(self.repo_path, commit_msg)
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.output.connect(self.append_log)
-        self.worker.error.connect(self.on_error)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.start()
+        # Hand the job to the persistent worker thread
+        self.worker.set_params(self.repo_path, commit_msg)
+        self.run_requested.emit()
 
     def append_log(self, text):
         self.log_output.append(text)
@@ -181,8 +211,15 @@ class MainWindow(QMainWindow):
         self.push_button.setEnabled(True)
         self.msg_input.clear()
 
+    def closeEvent(self, event):
+        # Shut the persistent worker thread down cleanly
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        super().closeEvent(event)
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    app.setStyleSheet(_STYLESHEET)
     window = MainWindow()
     window.resize(600, 400)
     window.show()